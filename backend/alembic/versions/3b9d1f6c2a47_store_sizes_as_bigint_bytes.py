@@ -0,0 +1,40 @@
+"""store dataset and model sizes as bigint bytes
+
+Revision ID: 3b9d1f6c2a47
+Revises: 5427840ea4e8
+Create Date: 2026-10-15 09:12:04.318226
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b9d1f6c2a47'
+down_revision: Union[str, None] = '5427840ea4e8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.alter_column('datasets', 'size',
+               existing_type=sa.Integer(),
+               type_=sa.BigInteger(),
+               existing_nullable=True)
+    op.alter_column('models', 'size',
+               existing_type=sa.Integer(),
+               type_=sa.BigInteger(),
+               existing_nullable=True)
+
+
+def downgrade() -> None:
+    op.alter_column('models', 'size',
+               existing_type=sa.BigInteger(),
+               type_=sa.Integer(),
+               existing_nullable=True)
+    op.alter_column('datasets', 'size',
+               existing_type=sa.BigInteger(),
+               type_=sa.Integer(),
+               existing_nullable=True)
@@ -0,0 +1,45 @@
+"""use jsonb for training, pipeline and project json columns
+
+Revision ID: 8c41e0d7b5f2
+Revises: 3b9d1f6c2a47
+Create Date: 2026-10-15 10:03:47.551902
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8c41e0d7b5f2'
+down_revision: Union[str, None] = '3b9d1f6c2a47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+JSON_COLUMNS = [
+    ('trainings', 'hyperparameters', True),
+    ('trainings', 'metrics', True),
+    ('pipelines', 'config', False),
+    ('pipelines', 'results', True),
+    ('projects', 'settings', True),
+]
+
+
+def upgrade() -> None:
+    for table, column, nullable in JSON_COLUMNS:
+        op.alter_column(table, column,
+                   existing_type=sa.JSON(),
+                   type_=postgresql.JSONB(astext_type=sa.Text()),
+                   existing_nullable=nullable,
+                   postgresql_using=f'{column}::jsonb')
+
+
+def downgrade() -> None:
+    for table, column, nullable in reversed(JSON_COLUMNS):
+        op.alter_column(table, column,
+                   existing_type=postgresql.JSONB(astext_type=sa.Text()),
+                   type_=sa.JSON(),
+                   existing_nullable=nullable,
+                   postgresql_using=f'{column}::json')
@@ -0,0 +1,44 @@
+"""native enum for deployment status
+
+Revision ID: a4d9f2c6e813
+Revises: e5a1c8b3f904
+Create Date: 2026-10-15 14:02:31.417790
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4d9f2c6e813'
+down_revision: Union[str, None] = 'e5a1c8b3f904'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+deployment_status = postgresql.ENUM(
+    'pending', 'deploying', 'active', 'failed', 'stopped',
+    name='deployment_status'
+)
+
+
+def upgrade() -> None:
+    deployment_status.create(op.get_bind(), checkfirst=True)
+
+    op.alter_column('deployments', 'status',
+               existing_type=sa.String(length=50),
+               type_=deployment_status,
+               existing_nullable=False,
+               postgresql_using='status::deployment_status')
+
+
+def downgrade() -> None:
+    op.alter_column('deployments', 'status',
+               existing_type=deployment_status,
+               type_=sa.String(length=50),
+               existing_nullable=False,
+               postgresql_using='status::text')
+
+    deployment_status.drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,32 @@
+"""add status polling indexes
+
+Revision ID: c27a9e4f1d68
+Revises: 8c41e0d7b5f2
+Create Date: 2026-10-15 10:41:26.093117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c27a9e4f1d68'
+down_revision: Union[str, None] = '8c41e0d7b5f2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_trainings_owner_status', 'trainings', ['owner_id', 'status'], unique=False)
+    op.create_index('ix_trainings_project_status_created', 'trainings', ['project_id', 'status', 'created_at'], unique=False)
+    op.create_index('ix_pipelines_owner_created', 'pipelines', ['owner_id', 'created_at'], unique=False)
+    op.create_index('ix_pipelines_dataset_status', 'pipelines', ['dataset_id', 'status'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_pipelines_dataset_status', table_name='pipelines')
+    op.drop_index('ix_pipelines_owner_created', table_name='pipelines')
+    op.drop_index('ix_trainings_project_status_created', table_name='trainings')
+    op.drop_index('ix_trainings_owner_status', table_name='trainings')
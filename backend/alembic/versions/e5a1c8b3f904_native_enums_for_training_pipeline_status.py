@@ -0,0 +1,60 @@
+"""native enums for training and pipeline status
+
+Revision ID: e5a1c8b3f904
+Revises: c27a9e4f1d68
+Create Date: 2026-10-15 11:27:55.806341
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5a1c8b3f904'
+down_revision: Union[str, None] = 'c27a9e4f1d68'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+training_status = postgresql.ENUM(
+    'queued', 'running', 'completed', 'failed', 'stopped',
+    name='training_status'
+)
+pipeline_status = postgresql.ENUM(
+    'pending', 'running', 'completed', 'failed',
+    name='pipeline_status'
+)
+
+
+def upgrade() -> None:
+    training_status.create(op.get_bind(), checkfirst=True)
+    pipeline_status.create(op.get_bind(), checkfirst=True)
+
+    op.alter_column('trainings', 'status',
+               existing_type=sa.String(),
+               type_=training_status,
+               existing_nullable=False,
+               postgresql_using='status::training_status')
+    op.alter_column('pipelines', 'status',
+               existing_type=sa.String(),
+               type_=pipeline_status,
+               existing_nullable=False,
+               postgresql_using='status::pipeline_status')
+
+
+def downgrade() -> None:
+    op.alter_column('pipelines', 'status',
+               existing_type=pipeline_status,
+               type_=sa.String(),
+               existing_nullable=False,
+               postgresql_using='status::text')
+    op.alter_column('trainings', 'status',
+               existing_type=training_status,
+               type_=sa.String(),
+               existing_nullable=False,
+               postgresql_using='status::text')
+
+    pipeline_status.drop(op.get_bind(), checkfirst=True)
+    training_status.drop(op.get_bind(), checkfirst=True)
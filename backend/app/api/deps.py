@@ -2,7 +2,7 @@
 from typing import AsyncGenerator, Generator
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError
+from jwt import PyJWTError as JWTError
 from sqlalchemy.orm import Session
 
 from app.core.config import settings
@@ -12,6 +12,8 @@ from app.services.auth.jwt import decode_access_token
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.API_V1_STR}/auth/login")
 
+_BEARER_HEADERS = {"WWW-Authenticate": "Bearer"}
+
 def get_db() -> Generator[Session, None, None]:
     """Get database session"""
     db = SessionLocal()
@@ -28,7 +30,7 @@ async def get_current_user(
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
+        headers=_BEARER_HEADERS,
     )
     try:
         # Decode token and get user_id from sub field
@@ -9,7 +9,7 @@ from app.api.deps import get_db
 from app.core.config import settings
 from app.services.auth.jwt import create_access_token
 from app.services.auth.security import get_password_hash, verify_password
-from app.schemas.token import Token
+from app.schemas.token import Token, TokenType
 from app.schemas.user import UserCreate, User
 from app.crud.crud_user import user_crud
 
@@ -43,7 +43,7 @@ async def login(
         "access_token": create_access_token(
             user.id, expires_delta=access_token_expires
         ),
-        "token_type": "bearer",
+        "token_type": TokenType.BEARER,
     }
 
 @router.post("/register", response_model=User)
@@ -62,4 +62,4 @@ async def register(
             detail="A user with this email already exists.",
         )
         
-    return user_crud.create(db, obj_in=user_in)
\ No newline at end of file
+    return await user_crud.create_async(db, obj_in=user_in)
\ No newline at end of file
@@ -34,14 +34,16 @@ async def upload_data(
 
         # Save file
         file_path = os.path.join(user_upload_dir, file.filename)
+        contents = await file.read()
         with open(file_path, "wb+") as file_object:
-            file_object.write(await file.read())
+            file_object.write(contents)
 
         # Create dataset record
         dataset = DatasetModel(
             name=file.filename,
             file_path=file_path,
             format=file_ext.lstrip('.'),
+            size=len(contents),
             owner_id=current_user.id
         )
         
@@ -5,7 +5,7 @@ from sqlalchemy.orm import Session
 
 from app.api.deps import get_current_user, get_db
 from app.schemas.deployment import DeploymentCreate, Deployment
-from app.models.deployment import Deployment as DeploymentModel
+from app.models.deployment import Deployment as DeploymentModel, DeploymentStatus
 from app.services.deployment.service import ModelDeploymentService
 from app.models.model import MLModel
 from app.core.config import settings
@@ -31,7 +31,7 @@ async def restart_deployment(
             detail="Deployment not found"
         )
     
-    if deployment.status == "active":
+    if deployment.status == DeploymentStatus.ACTIVE:
         raise HTTPException(
             status_code=400,
             detail="Deployment is already active"
@@ -56,7 +56,7 @@ async def restart_deployment(
             config=deployment.config
         )
         
-        deployment.status = "pending"
+        deployment.status = DeploymentStatus.PENDING
         db.commit()
         
         return {"status": "success", "message": "Deployment restart initiated"}
@@ -87,7 +87,7 @@ async def deploy_model_task(
             return
         
         # Update status to deploying
-        deployment.status = "deploying"
+        deployment.status = DeploymentStatus.DEPLOYING
         deployment.start_time = datetime.utcnow()
         db.commit()
         
@@ -109,7 +109,7 @@ async def deploy_model_task(
         )
         
         # Update deployment status
-        deployment.status = "active"
+        deployment.status = DeploymentStatus.ACTIVE
         deployment.endpoint_url = f"http://{settings.DEPLOYMENT_HOST}:{deployment.config.get('port', settings.DEPLOYMENT_PORT)}"
         deployment.end_time = datetime.utcnow()
         db.commit()
@@ -117,7 +117,7 @@ async def deploy_model_task(
     except Exception as e:
         # Update deployment status on failure
         if deployment:
-            deployment.status = "failed"
+            deployment.status = DeploymentStatus.FAILED
             deployment.error_message = str(e)
             deployment.end_time = datetime.utcnow()
             db.commit()
@@ -136,7 +136,7 @@ async def create_deployment(
             description=deployment_in.description,
             model_id=deployment_in.model_id,
             config=deployment_in.config,
-            status="pending",
+            status=DeploymentStatus.PENDING,
             owner_id=current_user.id
         )
         
@@ -204,8 +204,8 @@ async def delete_deployment(
         )
     
     try:
-        if deployment.status == "active":
-            deployment.status = "stopped"
+        if deployment.status == DeploymentStatus.ACTIVE:
+            deployment.status = DeploymentStatus.STOPPED
             deployment.end_time = datetime.utcnow()
         
         db.delete(deployment)
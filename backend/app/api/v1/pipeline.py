@@ -1,7 +1,7 @@
 # app/api/v1/pipeline.py
 from typing import Any
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, undefer
 import uuid
 import logging
 from datetime import datetime
@@ -10,10 +10,10 @@ import json
 from app.api.deps import get_current_user, get_db
 from app.models.user import User
 from app.models.dataset import Dataset
-from app.models.pipeline import Pipeline
+from app.models.pipeline import Pipeline, PipelineStatus
 from app.schemas.pipeline import PipelineRequest, PipelineResponse
 from app.services.pipeline.integration import PipelineIntegrationService
-from app.utils.serialization import convert_numpy_types, NumpyJSONEncoder
+from app.utils.serialization import to_json_compatible
 from typing import List
 from app.schemas.pipeline import PipelineResponse, PipelineListResponse
 
@@ -49,12 +49,15 @@ async def process_data(
                 detail="Dataset file path is missing"
             )
 
+        # Dump the validated config once and share it below
+        pipeline_config = request.config.model_dump()
+
         # Create pipeline record
         pipeline_id = str(uuid.uuid4())
         pipeline = Pipeline(
             pipeline_id=pipeline_id,
-            status="pending",
-            config=request.config.dict(),
+            status=PipelineStatus.PENDING,
+            config=pipeline_config,
             owner_id=current_user.id,
             dataset_id=dataset.id
         )
@@ -65,17 +68,17 @@ async def process_data(
 
         try:
             # Initialize pipeline service
-            pipeline_service = PipelineIntegrationService(config=request.config.dict())
+            pipeline_service = PipelineIntegrationService(config=pipeline_config)
 
             # Update status to running
-            pipeline.update_status("running")
+            pipeline.update_status(PipelineStatus.RUNNING)
             db.commit()
             db.refresh(pipeline)  # Refresh to get updated timestamps
 
             # Process dataset
             results = await pipeline_service.process_dataset(
                 data=dataset.file_path,
-                pipeline_config=request.config.dict(),
+                pipeline_config=pipeline_config,
                 save_intermediate=True
             )
 
@@ -83,18 +86,18 @@ async def process_data(
                 raise ValueError("Pipeline processing returned no results")
 
             # Convert numpy types to Python native types before storing
-            converted_results = convert_numpy_types(results)
+            converted_results = to_json_compatible(results)
 
             # Update pipeline with results
             pipeline.results = converted_results
-            pipeline.update_status("completed")
+            pipeline.update_status(PipelineStatus.COMPLETED)
             db.commit()
             db.refresh(pipeline)  # Refresh to get final timestamps
 
             # Construct response with all required fields
             response = PipelineResponse(
                 pipeline_id=pipeline_id,
-                status="completed",
+                status=PipelineStatus.COMPLETED,
                 dataset_id=request.dataset_id,
                 config=request.config,
                 results=converted_results,
@@ -111,7 +114,7 @@ async def process_data(
         except Exception as e:
             logger.error(f"Pipeline processing error: {str(e)}")
             if pipeline:
-                pipeline.update_status("failed", str(e))
+                pipeline.update_status(PipelineStatus.FAILED, str(e))
                 db.commit()
                 db.refresh(pipeline)
             raise HTTPException(status_code=500, detail=f"Pipeline processing failed: {str(e)}")
@@ -163,6 +166,7 @@ async def get_pipeline(
     try:
         pipeline = (
             db.query(Pipeline)
+            .options(undefer(Pipeline.config), undefer(Pipeline.results))
             .filter(
                 Pipeline.pipeline_id == pipeline_id,
                 Pipeline.owner_id == current_user.id
@@ -1,12 +1,12 @@
-from typing import Any
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
-from sqlalchemy.orm import Session
+from typing import Any, List
+from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Query
+from sqlalchemy.orm import Session, undefer
 from datetime import datetime
 
 from app.api.deps import get_current_user, get_db
-from app.schemas.training import TrainingCreate, Training
+from app.schemas.training import TrainingCreate, Training, TrainingStatusSummary
 from app.services.ml.training.trainer import start_training_job
-from app.models.training import Training as TrainingModel
+from app.models.training import Training as TrainingModel, TrainingStatus
 
 router = APIRouter()
 
@@ -26,7 +26,7 @@ async def start_training(
         model_id=training_in.model_id,
         dataset_id=training_in.dataset_id,
         hyperparameters=training_in.hyperparameters,
-        status="queued",
+        status=TrainingStatus.QUEUED,
         owner_id=current_user.id,
         updated_at=datetime.utcnow()  # Ensure updated_at is set
     )
@@ -43,6 +43,18 @@ async def start_training(
     
     return training
 
+@router.get("/status", response_model=List[TrainingStatusSummary])
+def get_training_statuses(
+    ids: List[int] = Query(...),
+    db: Session = Depends(get_db),
+    current_user: Any = Depends(get_current_user)
+) -> Any:
+    """
+    Get the status of several training jobs in one request.
+    """
+    trainings = TrainingModel.get_statuses(db, ids, owner_id=current_user.id)
+    return list(trainings.values())
+
 @router.get("/{training_id}/status", response_model=Training)
 def get_training_status(
     training_id: int,
@@ -52,7 +64,9 @@ def get_training_status(
     """
     Get training job status.
     """
-    training = db.query(TrainingModel).filter(
+    training = db.query(TrainingModel).options(
+        undefer(TrainingModel.metrics)
+    ).filter(
         TrainingModel.id == training_id,
         TrainingModel.owner_id == current_user.id
     ).first()
@@ -0,0 +1,38 @@
+# app/core/enums.py
+# Shared by the ORM models and the API schemas; keep this module free of
+# SQLAlchemy imports so loading a schema never configures the mappers.
+import enum
+
+class TrainingStatus(str, enum.Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    STOPPED = "stopped"
+
+class PipelineStatus(str, enum.Enum):
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+class DeploymentStatus(str, enum.Enum):
+    PENDING = "pending"
+    DEPLOYING = "deploying"
+    ACTIVE = "active"
+    FAILED = "failed"
+    STOPPED = "stopped"
+
+class TokenType(str, enum.Enum):
+    BEARER = "bearer"
+
+class DatasetFormat(str, enum.Enum):
+    CSV = "csv"
+    JSON = "json"
+    PARQUET = "parquet"
+    XLSX = "xlsx"
+
+class ModelFramework(str, enum.Enum):
+    PYTORCH = "pytorch"
+    TENSORFLOW = "tensorflow"
+    SKLEARN = "sklearn"
@@ -1,3 +1,4 @@
+import asyncio
 from typing import Any, Dict, Optional, Union
 
 from sqlalchemy.orm import Session
@@ -14,13 +15,17 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
         """
         return db.query(User).filter(User.email == email).first()
 
-    def create(self, db: Session, *, obj_in: UserCreate) -> User:
+    def create(
+        self, db: Session, *, obj_in: UserCreate, hashed_password: Optional[str] = None
+    ) -> User:
         """
         Create new user with hashed password.
+        
+        Pass hashed_password when the hash was already computed elsewhere.
         """
         db_obj = User(
             email=obj_in.email,
-            hashed_password=get_password_hash(obj_in.password),
+            hashed_password=hashed_password or get_password_hash(obj_in.password),
             full_name=obj_in.full_name,
             is_superuser=obj_in.is_superuser if hasattr(obj_in, "is_superuser") else False,
             is_active=obj_in.is_active if hasattr(obj_in, "is_active") else True
@@ -30,6 +35,14 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
         db.refresh(db_obj)
         return db_obj
 
+    async def create_async(self, db: Session, *, obj_in: UserCreate) -> User:
+        """
+        Create new user, hashing the password off the event loop.
+        """
+        loop = asyncio.get_running_loop()
+        hashed_password = await loop.run_in_executor(None, get_password_hash, obj_in.password)
+        return self.create(db, obj_in=obj_in, hashed_password=hashed_password)
+
     def update(
         self, db: Session, *, db_obj: User, obj_in: Union[UserUpdate, Dict[str, Any]]
     ) -> User:
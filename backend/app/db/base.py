@@ -9,6 +9,7 @@ from app.models.model import MLModel  # Note the MLModel import
 from app.models.training import Training
 from app.models.evaluation import Evaluation
 from app.models.deployment import Deployment
+from app.models.pipeline import Pipeline
 
 # This allows all models to be registered with SQLAlchemy
 __all__ = [
@@ -19,5 +20,6 @@ __all__ = [
     "MLModel",
     "Training",
     "Evaluation",
-    "Deployment"
+    "Deployment",
+    "Pipeline"
 ]
\ No newline at end of file
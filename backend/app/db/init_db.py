@@ -8,7 +8,7 @@ from app.db.session import SessionLocal
 def init_db() -> None:
     """Initialize the database. Create all tables."""
     # Import all models here to ensure they are registered
-    from app.models import User, Project, Dataset, Model, Training, Evaluation
+    from app.models import User, Project, Dataset, MLModel, Training, Evaluation, Pipeline, Deployment
     Base.metadata.create_all(bind=engine)
 
 def get_db():
@@ -2,8 +2,10 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.pool import AsyncAdaptedQueuePool
+import orjson
 
 from app.core.config import settings
+from app.utils.serialization import dumps_json_str
 
 # Create async database engine
 async_engine = create_async_engine(
@@ -12,6 +14,8 @@ async_engine = create_async_engine(
     pool_size=5,
     max_overflow=10,
     poolclass=AsyncAdaptedQueuePool,  # Changed to AsyncAdaptedQueuePool
+    json_serializer=dumps_json_str,
+    json_deserializer=orjson.loads,
     echo=False
 )
 
@@ -21,6 +25,8 @@ engine = create_engine(
     pool_pre_ping=True,
     pool_size=5,
     max_overflow=10,
+    json_serializer=dumps_json_str,
+    json_deserializer=orjson.loads,
     echo=False
 )
 
@@ -0,0 +1,19 @@
+# app/db/types.py
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.types import TypeDecorator, JSON
+
+
+class CachedJSON(TypeDecorator):
+    """JSON column type that is safe to include in the compiled statement cache.
+
+    Stored as JSONB on PostgreSQL so rows are kept pre-parsed and can be
+    indexed; other dialects fall back to the generic JSON type.
+    """
+
+    impl = JSON
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(JSONB())
+        return dialect.type_descriptor(JSON())
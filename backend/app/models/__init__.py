@@ -1,4 +1,6 @@
 # app/models/__init__.py
+from sqlalchemy.orm import configure_mappers
+
 from .user import User
 from .project import Project
 from .dataset import Dataset
@@ -6,6 +8,10 @@ from .model import MLModel  # Changed from Model to MLModel
 from .training import Training
 from .evaluation import Evaluation
 from .pipeline import Pipeline
+from .deployment import Deployment
+
+# Resolve relationships once at import rather than on the first query
+configure_mappers()
 
 __all__ = [
     "User",
@@ -14,5 +20,6 @@ __all__ = [
     "MLModel",
     "Training",
     "Evaluation",
-    "Pipeline"
+    "Pipeline",
+    "Deployment"
 ]
\ No newline at end of file
@@ -1,14 +0,0 @@
-# app/models/base.py
-from datetime import datetime
-from typing import Any
-from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
-from sqlalchemy import DateTime
-
-class Base(DeclarativeBase):
-    """Base class for all database models"""
-    
-    __abstract__ = True
-
-    id: Mapped[int] = mapped_column(primary_key=True, index=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
\ No newline at end of file
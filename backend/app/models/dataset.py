@@ -1,6 +1,6 @@
 # app/models/dataset.py
 from typing import TYPE_CHECKING
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, JSON
+from sqlalchemy import Column, Integer, BigInteger, String, DateTime, ForeignKey, JSON
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
@@ -20,7 +20,7 @@ class Dataset(Base):
     description = Column(String)
     format = Column(String, nullable=False)
     file_path = Column(String, nullable=False)
-    size = Column(Integer)
+    size = Column(BigInteger)  # in bytes
     num_rows = Column(Integer)
     num_features = Column(Integer)
     preprocessing_config = Column(JSON)
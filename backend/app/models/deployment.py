@@ -1,12 +1,13 @@
 # app/models/deployment.py
 from typing import TYPE_CHECKING, Optional, Dict, Any
 
-from sqlalchemy import Boolean, Column, Integer, String, DateTime, ForeignKey, JSON
+from sqlalchemy import Boolean, Column, Integer, String, DateTime, ForeignKey, JSON, Enum
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from datetime import datetime
 
 from app.db.base_class import Base
+from app.core.enums import DeploymentStatus
 
 if TYPE_CHECKING:
     from .user import User
@@ -24,7 +25,15 @@ class Deployment(Base):
     owner_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     
     # Status and Configuration
-    status = Column(String(50), nullable=False, default="pending")  # pending, deploying, active, failed, stopped
+    status = Column(
+        Enum(
+            DeploymentStatus,
+            name="deployment_status",
+            values_callable=lambda statuses: [s.value for s in statuses]
+        ),
+        nullable=False,
+        default=DeploymentStatus.PENDING
+    )
     config = Column(JSON)
     endpoint_url = Column(String(255))
     error_message = Column(String(1000))
@@ -42,12 +51,9 @@ class Deployment(Base):
     owner = relationship("User", back_populates="deployments")
     model = relationship("MLModel", back_populates="deployments")
 
-    def __repr__(self):
-        return f"<Deployment {self.name} (ID: {self.id})>"
-
     @property
     def is_active(self) -> bool:
-        return self.status == "active"
+        return self.status == DeploymentStatus.ACTIVE
 
     @property
     def duration(self) -> Optional[float]:
@@ -61,10 +67,10 @@ class Deployment(Base):
         self.status = status
         self.updated_at = datetime.utcnow()
         
-        if status == "active":
+        if status == DeploymentStatus.ACTIVE:
             if not self.start_time:
                 self.start_time = datetime.utcnow()
-        elif status in ["failed", "stopped"]:
+        elif status in (DeploymentStatus.FAILED, DeploymentStatus.STOPPED):
             self.end_time = datetime.utcnow()
             if error_message:
                 self.error_message = error_message
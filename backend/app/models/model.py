@@ -1,6 +1,6 @@
 # app/models/model.py
 from typing import TYPE_CHECKING
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, JSON, Boolean
+from sqlalchemy import Column, Integer, BigInteger, String, DateTime, ForeignKey, JSON, Boolean
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
@@ -29,7 +29,7 @@ class MLModel(Base):
     metrics = Column(JSON, default={})
     file_path = Column(String)
     preprocessor_path = Column(String)
-    size = Column(Integer)
+    size = Column(BigInteger)  # in bytes
     is_default = Column(Boolean, default=False)
     
     # Foreign Keys
@@ -45,4 +45,4 @@ class MLModel(Base):
     project = relationship("Project", back_populates="models")
     trainings = relationship("Training", back_populates="model", cascade="all, delete-orphan")
     evaluations = relationship("Evaluation", back_populates="model", cascade="all, delete-orphan")
-    deployments = relationship("Deployment", back_populates="model", cascade="all, delete-orphan")
\ No newline at end of file
+    deployments = relationship("Deployment", back_populates="model", cascade="all, delete-orphan")
@@ -1,27 +1,46 @@
 # app/models/pipeline.py
 from typing import TYPE_CHECKING, Optional, Dict, Any
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, JSON
-from sqlalchemy.orm import relationship, Mapped
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index, Enum
+from sqlalchemy.orm import relationship, Mapped, deferred
 from sqlalchemy.sql import func
-from datetime import datetime
-import pytz
-import json
+from datetime import datetime, timezone
+import orjson
 
 from app.db.base_class import Base
-from app.utils.serialization import convert_numpy_types, NumpyJSONEncoder
+from app.db.types import CachedJSON
+from app.core.enums import PipelineStatus
+from app.utils.serialization import to_json_compatible
 
 if TYPE_CHECKING:
     from .user import User
     from .dataset import Dataset
 
+_FINISHED_STATUSES = frozenset({PipelineStatus.COMPLETED, PipelineStatus.FAILED})
+
+def _utc_now() -> datetime:
+    """Get current UTC time with timezone"""
+    return datetime.now(timezone.utc)
+
 class Pipeline(Base):
     __tablename__ = "pipelines"
+    __table_args__ = (
+        Index("ix_pipelines_owner_created", "owner_id", "created_at"),
+        Index("ix_pipelines_dataset_status", "dataset_id", "status"),
+    )
 
     id: Mapped[int] = Column(Integer, primary_key=True, index=True)
     pipeline_id: Mapped[str] = Column(String, unique=True, nullable=False)  # UUID
-    status: Mapped[str] = Column(String, nullable=False)  # pending, running, completed, failed
-    config: Mapped[Dict] = Column(JSON, nullable=False)
-    results: Mapped[Optional[Dict]] = Column(JSON)
+    status: Mapped[PipelineStatus] = Column(
+        Enum(
+            PipelineStatus,
+            name="pipeline_status",
+            values_callable=lambda statuses: [s.value for s in statuses]
+        ),
+        nullable=False
+    )
+    # Large payloads; only loaded on access or via undefer()
+    config: Mapped[Dict] = deferred(Column(CachedJSON, nullable=False))
+    results: Mapped[Optional[Dict]] = deferred(Column(CachedJSON))
     error_message: Mapped[Optional[str]] = Column(String)
 
     # Foreign Keys
@@ -54,28 +73,24 @@ class Pipeline(Base):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         # Initialize timestamps with timezone-aware values
+        now = _utc_now()
         if not self.created_at:
-            self.created_at = datetime.now(pytz.UTC)
+            self.created_at = now
         if not self.updated_at:
-            self.updated_at = datetime.now(pytz.UTC)
-
-    def get_utc_now(self) -> datetime:
-        """Get current UTC time with timezone"""
-        return datetime.now(pytz.UTC)
+            self.updated_at = now
 
     def update_status(self, status: str, error_message: Optional[str] = None) -> None:
         """Update pipeline status and related fields"""
+        current_time = _utc_now()
         self.status = status
-        self.updated_at = self.get_utc_now()
+        self.updated_at = current_time
         
         if error_message:
             self.error_message = error_message
-
-        current_time = self.get_utc_now()
         
-        if status == "running":
+        if status == PipelineStatus.RUNNING:
             self.start_time = current_time
-        elif status in ["completed", "failed"]:
+        elif status in _FINISHED_STATUSES:
             self.end_time = current_time
             if self.start_time:
                 # Both times are timezone-aware, safe to subtract
@@ -84,21 +99,21 @@ class Pipeline(Base):
 
     @property
     def results_json(self) -> Optional[Dict[str, Any]]:
-        """Get results as JSON with numpy types converted"""
+        """Get results as JSON; values are already sanitized by the setter or the DB round trip"""
         if self.results:
             if isinstance(self.results, str):
-                return json.loads(self.results)
-            return convert_numpy_types(self.results)
+                return orjson.loads(self.results)
+            return self.results
         return None
 
     @results_json.setter
     def results_json(self, value: Dict[str, Any]) -> None:
         """Set results with numpy type conversion"""
         if value is not None:
-            converted_value = convert_numpy_types(value)
+            converted_value = to_json_compatible(value)
             # Store as a dictionary instead of JSON string
             self.results = converted_value
-            self.updated_at = self.get_utc_now()
+            self.updated_at = _utc_now()
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert pipeline to dictionary format"""
@@ -114,4 +129,4 @@ class Pipeline(Base):
             'end_time': self.end_time,
             'execution_time': self.execution_time,
             'error_message': self.error_message
-        }
\ No newline at end of file
+        }
@@ -1,10 +1,11 @@
 # app/models/project.py
 from typing import TYPE_CHECKING
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, JSON
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
 from app.db.base_class import Base
+from app.db.types import CachedJSON
 
 if TYPE_CHECKING:
     from .user import User
@@ -19,7 +20,7 @@ class Project(Base):
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, nullable=False)
     description = Column(String)
-    settings = Column(JSON)
+    settings = Column(CachedJSON)
     
     # Foreign Keys
     owner_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"))
@@ -30,7 +31,7 @@ class Project(Base):
     
     # Relationships
     owner = relationship("User", back_populates="projects")
-    datasets = relationship("Dataset", back_populates="project")
-    models = relationship("MLModel", back_populates="project")
-    trainings = relationship("Training", back_populates="project")
-    evaluations = relationship("Evaluation", back_populates="project")
\ No newline at end of file
+    datasets = relationship("Dataset", back_populates="project", lazy="selectin", passive_deletes=True)
+    models = relationship("MLModel", back_populates="project", lazy="selectin", passive_deletes=True)
+    trainings = relationship("Training", back_populates="project", lazy="selectin", passive_deletes=True)
+    evaluations = relationship("Evaluation", back_populates="project", lazy="raise", passive_deletes=True)
\ No newline at end of file
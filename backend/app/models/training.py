@@ -1,9 +1,11 @@
-from typing import TYPE_CHECKING
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, JSON, Float
-from sqlalchemy.orm import relationship
+from typing import TYPE_CHECKING, Dict, Iterable, Optional
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Float, Index, Enum, select
+from sqlalchemy.orm import relationship, load_only, deferred, Session
 from sqlalchemy.sql import func
 
 from app.db.base_class import Base
+from app.db.types import CachedJSON
+from app.core.enums import TrainingStatus
 
 if TYPE_CHECKING:
     from .user import User
@@ -14,11 +16,23 @@ if TYPE_CHECKING:
 
 class Training(Base):
     __tablename__ = "trainings"
+    __table_args__ = (
+        Index("ix_trainings_owner_status", "owner_id", "status"),
+        Index("ix_trainings_project_status_created", "project_id", "status", "created_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
-    status = Column(String, nullable=False, default="queued")
-    hyperparameters = Column(JSON, nullable=True)
-    metrics = Column(JSON, nullable=True)
+    status = Column(
+        Enum(
+            TrainingStatus,
+            name="training_status",
+            values_callable=lambda statuses: [s.value for s in statuses]
+        ),
+        nullable=False,
+        default=TrainingStatus.QUEUED
+    )
+    hyperparameters = Column(CachedJSON, nullable=True)
+    metrics = deferred(Column(CachedJSON, nullable=True))
     
     # Resource Usage
     cpu_usage = Column(Float, nullable=True)
@@ -46,3 +60,26 @@ class Training(Base):
     dataset = relationship("Dataset", back_populates="trainings")
     project = relationship("Project", back_populates="trainings")
     evaluations = relationship("Evaluation", back_populates="training")
+
+    @classmethod
+    def get_statuses(
+        cls,
+        session: Session,
+        ids: Iterable[int],
+        owner_id: Optional[int] = None
+    ) -> Dict[int, "Training"]:
+        """Fetch status fields for many trainings in a single query, keyed by id in request order"""
+        ids = list(ids)
+        if not ids:
+            return {}
+
+        stmt = (
+            select(cls)
+            .options(load_only(cls.id, cls.status, cls.start_time, cls.end_time, cls.error_message))
+            .where(cls.id.in_(ids))
+        )
+        if owner_id is not None:
+            stmt = stmt.where(cls.owner_id == owner_id)
+
+        found = {row.id: row for row in session.execute(stmt).scalars()}
+        return {id_: found[id_] for id_ in ids if id_ in found}
@@ -1,8 +1,8 @@
 # app/models/user.py
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional, List, TYPE_CHECKING
-from sqlalchemy import Column, Boolean, String, Integer, DateTime, event
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Boolean, String, Integer, DateTime
+from sqlalchemy.orm import relationship, validates
 from sqlalchemy.sql import func
 
 from app.db.base_class import Base
@@ -32,14 +32,20 @@ class User(Base):
     last_login = Column(DateTime(timezone=True))
     
     # Relationships
-    projects = relationship("Project", back_populates="owner", cascade="all, delete-orphan")
-    datasets = relationship("Dataset", back_populates="owner", cascade="all, delete-orphan")
-    models = relationship("MLModel", back_populates="owner", cascade="all, delete-orphan")
-    trainings = relationship("Training", back_populates="owner", cascade="all, delete-orphan")
-    evaluations = relationship("Evaluation", back_populates="owner", cascade="all, delete-orphan")
-    deployments = relationship("Deployment", back_populates="owner", cascade="all, delete-orphan")
-    pipelines = relationship("Pipeline", back_populates="owner", cascade="all, delete-orphan")
+    # Collections must be loaded explicitly (e.g. selectinload); the database
+    # cascades deletes, so the ORM never has to load them itself.
+    projects = relationship("Project", back_populates="owner", cascade="all, delete-orphan", lazy="raise", passive_deletes=True)
+    datasets = relationship("Dataset", back_populates="owner", cascade="all, delete-orphan", lazy="raise", passive_deletes=True)
+    models = relationship("MLModel", back_populates="owner", cascade="all, delete-orphan", lazy="raise", passive_deletes=True)
+    trainings = relationship("Training", back_populates="owner", cascade="all, delete-orphan", lazy="raise", passive_deletes=True)
+    evaluations = relationship("Evaluation", back_populates="owner", cascade="all, delete-orphan", lazy="raise", passive_deletes=True)
+    deployments = relationship("Deployment", back_populates="owner", cascade="all, delete-orphan", lazy="raise", passive_deletes=True)
+    pipelines = relationship("Pipeline", back_populates="owner", cascade="all, delete-orphan", lazy="raise", passive_deletes=True)
     
+    @validates("email")
+    def _normalize_email(self, key: str, email: Optional[str]) -> Optional[str]:
+        return email.lower() if email else email
+
     def verify_password(self, password: str) -> bool:
         return verify_password(password, self.hashed_password)
 
@@ -47,17 +53,7 @@ class User(Base):
         self.hashed_password = get_password_hash(password)
 
     def update_last_login(self) -> None:
-        self.last_login = datetime.utcnow()
+        self.last_login = datetime.now(timezone.utc)
 
     def __repr__(self):
         return f"<User {self.email}>"
-
-@event.listens_for(User, 'before_insert')
-def user_before_insert(mapper, connection, target):
-    if target.email:
-        target.email = target.email.lower()
-
-@event.listens_for(User, 'before_update')
-def user_before_update(mapper, connection, target):
-    if target.email:
-        target.email = target.email.lower()
\ No newline at end of file
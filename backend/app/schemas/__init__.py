@@ -1,32 +1,39 @@
 # app/schemas/__init__.py
-from .base import TimestampMixin
-from .token import Token, TokenPayload, TokenData
-from .user import User, UserCreate, UserUpdate
-from .project import Project, ProjectCreate, ProjectUpdate
-from .dataset import Dataset, DatasetCreate, DatasetUpdate
-from .model import MLModel, MLModelCreate, MLModelUpdate  # Updated names
-from .training import Training, TrainingCreate, TrainingUpdate, TrainingStatus
-from .evaluation import Evaluation, EvaluationCreate, EvaluationUpdate
-from .relationships import TrainingWithRelations, EvaluationWithRelations
-from .deployment import Deployment, DeploymentCreate, DeploymentUpdate
-from .pipeline import PreprocessingConfig, AnalysisConfig, AugmentationConfig, PipelineConfig, PipelineRequest, PipelineResponse
+# Submodules are imported on first attribute access (PEP 562), so importing
+# e.g. app.schemas.token doesn't build every schema in the package.
+import importlib
 
+_EXPORTS = {
+    "TimestampMixin": ".base",
+    "Token": ".token", "TokenPayload": ".token", "TokenData": ".token",
+    "User": ".user", "UserCreate": ".user", "UserUpdate": ".user",
+    "Project": ".project", "ProjectCreate": ".project", "ProjectUpdate": ".project",
+    "Dataset": ".dataset", "DatasetCreate": ".dataset", "DatasetUpdate": ".dataset",
+    "MLModel": ".model", "MLModelCreate": ".model", "MLModelUpdate": ".model",
+    "Training": ".training", "TrainingCreate": ".training", "TrainingUpdate": ".training",
+    "TrainingStatus": ".training", "TrainingStatusSummary": ".training",
+    "Evaluation": ".evaluation", "EvaluationCreate": ".evaluation", "EvaluationUpdate": ".evaluation",
+    "TrainingWithRelations": ".relationships", "EvaluationWithRelations": ".relationships",
+    "Deployment": ".deployment", "DeploymentCreate": ".deployment", "DeploymentUpdate": ".deployment",
+    "PreprocessingConfig": ".pipeline",
+    "AnalysisConfig": ".pipeline",
+    "AugmentationConfig": ".pipeline",
+    "PipelineConfig": ".pipeline",
+    "PipelineRequest": ".pipeline",
+    "PipelineResponse": ".pipeline",
+}
 
+__all__ = list(_EXPORTS)
 
-__all__ = [
-    "TimestampMixin",
-    "Token", "TokenPayload", "TokenData",
-    "User", "UserCreate", "UserUpdate",
-    "Project", "ProjectCreate", "ProjectUpdate",
-    "Dataset", "DatasetCreate", "DatasetUpdate",
-    "MLModel", "MLModelCreate", "MLModelUpdate",  # Updated names
-    "Training", "TrainingCreate", "TrainingUpdate", "TrainingStatus",
-    "Evaluation", "EvaluationCreate", "EvaluationUpdate",
-    "TrainingWithRelations", "EvaluationWithRelations","Deployment" , "DeploymentCreate", "DeploymentUpdate",
-    "PreprocessingConfig",
-    "AnalysisConfig",
-    "AugmentationConfig",
-    "PipelineConfig",
-    "PipelineRequest",
-    "PipelineResponse"
-]
\ No newline at end of file
+
+def __getattr__(name: str):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # cache so later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
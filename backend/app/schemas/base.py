@@ -1,9 +1,14 @@
 from datetime import datetime
-from pydantic import BaseModel
+from typing import Any, Optional
+from pydantic import BaseModel, ConfigDict
+
+# Shared aliases for free-form JSON columns
+JSONDict = dict[str, Any]
+OptJSONDict = Optional[JSONDict]
 
 class TimestampMixin(BaseModel):
+    """Base for read-only schemas built from ORM rows"""
     created_at: datetime
-    updated_at: datetime
+    updated_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True, frozen=True)
\ No newline at end of file
@@ -1,13 +1,15 @@
 # app/schemas/dataset.py
-from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional
 from pydantic import BaseModel
 
+from app.core.enums import DatasetFormat
+from .base import TimestampMixin, OptJSONDict
+
 class DatasetBase(BaseModel):
     name: str
     description: Optional[str] = None
-    format: str
-    preprocessing_config: Optional[Dict[str, Any]] = None
+    format: DatasetFormat
+    preprocessing_config: OptJSONDict = None
 
 class DatasetCreate(DatasetBase):
     pass
@@ -16,7 +18,7 @@ class DatasetUpdate(DatasetBase):
     pass
 
 # Renamed from DatasetResponse to Dataset
-class Dataset(DatasetBase):
+class Dataset(DatasetBase, TimestampMixin):
     id: int
     owner_id: int
     project_id: Optional[int] = None
@@ -24,9 +26,4 @@ class Dataset(DatasetBase):
     size: Optional[int] = None
     num_rows: Optional[int] = None
     num_features: Optional[int] = None
-    meta_info: Optional[Dict[str, Any]] = None
-    created_at: datetime
-    updated_at: Optional[datetime] = None
-
-    class Config:
-        from_attributes = True
\ No newline at end of file
+    meta_info: OptJSONDict = None
\ No newline at end of file
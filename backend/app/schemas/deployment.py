@@ -1,13 +1,16 @@
 # app/schemas/deployment.py
-from typing import Optional, Dict, Any
+from typing import Optional
 from pydantic import BaseModel
 from datetime import datetime
 
+from app.core.enums import DeploymentStatus
+from .base import TimestampMixin, OptJSONDict
+
 class DeploymentBase(BaseModel):
     name: str
     description: Optional[str] = None
     model_id: int
-    config: Optional[Dict[str, Any]] = None
+    config: OptJSONDict = None
     endpoint_url: Optional[str] = None
 
 class DeploymentCreate(DeploymentBase):
@@ -16,20 +19,15 @@ class DeploymentCreate(DeploymentBase):
 class DeploymentUpdate(BaseModel):
     name: Optional[str] = None
     description: Optional[str] = None
-    config: Optional[Dict[str, Any]] = None
-    status: Optional[str] = None
+    config: OptJSONDict = None
+    status: Optional[DeploymentStatus] = None
     endpoint_url: Optional[str] = None
 
-class Deployment(DeploymentBase):
+class Deployment(DeploymentBase, TimestampMixin):
     id: int
     owner_id: int
-    status: str
-    created_at: datetime
-    updated_at: Optional[datetime] = None
+    status: DeploymentStatus
     start_time: Optional[datetime] = None
     end_time: Optional[datetime] = None
     error_message: Optional[str] = None
-    metrics: Optional[Dict[str, Any]] = None
-
-    class Config:
-        from_attributes = True
\ No newline at end of file
+    metrics: OptJSONDict = None
\ No newline at end of file
@@ -1,6 +1,7 @@
-from typing import Optional, Dict, Any, List
-from datetime import datetime
-from pydantic import BaseModel, Field
+from typing import Optional
+from pydantic import BaseModel, ConfigDict
+
+from .base import TimestampMixin
 
 class MetricsConfig(BaseModel):
     accuracy: bool = False
@@ -12,36 +13,50 @@ class MetricsConfig(BaseModel):
     mae: bool = False
     r2: bool = False
 
+    model_config = ConfigDict(frozen=True)
+
 class EvaluationParameters(BaseModel):
     test_split: float = 0.2
     random_seed: int = 42
     threshold: float = 0.5
 
+    model_config = ConfigDict(frozen=True)
+
+class MetricsResult(BaseModel):
+    accuracy: Optional[float] = None
+    precision: Optional[float] = None
+    recall: Optional[float] = None
+    f1_score: Optional[float] = None
+    mse: Optional[float] = None
+    rmse: Optional[float] = None
+    mae: Optional[float] = None
+    r2: Optional[float] = None
+
+class ConfusionMatrix(BaseModel):
+    matrix: list[list[int]]
+    labels: list[str]
+    predictions: list[str]
+
 class EvaluationCreate(BaseModel):
     dataset_id: int
     metrics: MetricsConfig
     parameters: EvaluationParameters
 
 class EvaluationUpdate(BaseModel):
-    metrics: Optional[Dict[str, Any]] = None
-    parameters: Optional[Dict[str, Any]] = None
+    metrics: Optional[MetricsResult] = None
+    parameters: Optional[EvaluationParameters] = None
 
-class Evaluation(BaseModel):
+class Evaluation(TimestampMixin):
     id: int
     model_id: int
     dataset_id: int
     owner_id: int
-    metrics: Dict[str, Any]
-    parameters: Dict[str, Any]
-    confusion_matrix: Optional[Dict[str, List[Any]]] = None
-    feature_importance: Optional[Dict[str, float]] = None
+    metrics: MetricsResult
+    parameters: EvaluationParameters
+    confusion_matrix: Optional[ConfusionMatrix] = None
+    feature_importance: Optional[dict[str, float]] = None
     execution_time: Optional[float] = None
     accuracy: Optional[float] = None
     precision: Optional[float] = None
     recall: Optional[float] = None
     f1_score: Optional[float] = None
-    created_at: datetime
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
-
-    class Config:
-        from_attributes = True
\ No newline at end of file
@@ -1,32 +1,30 @@
 # app/schemas/model.py
-from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional
 from pydantic import BaseModel
 
+from app.core.enums import ModelFramework
+from .base import TimestampMixin, OptJSONDict
+
 class MLModelBase(BaseModel):
     name: str
     description: Optional[str] = None
     framework: str
     architecture: str
     version: str = "1.0.0"
-    config: Optional[Dict[str, Any]] = {}
-    hyperparameters: Optional[Dict[str, Any]] = {}
+    config: OptJSONDict = {}
+    hyperparameters: OptJSONDict = {}
 
 class MLModelCreate(MLModelBase):
-    pass
+    # Only checked on input; stored rows may predate the restriction
+    framework: ModelFramework
 
-class MLModelUpdate(MLModelBase):
+class MLModelUpdate(MLModelCreate):
     pass
 
-class MLModel(MLModelBase):
+class MLModel(MLModelBase, TimestampMixin):
     id: int
     owner_id: int
     project_id: Optional[int] = None
-    metrics: Optional[Dict[str, Any]] = {}
+    metrics: OptJSONDict = {}
     size: Optional[int] = None
-    is_default: bool = False
-    created_at: datetime
-    updated_at: Optional[datetime] = None
-
-    class Config:
-        from_attributes = True
\ No newline at end of file
+    is_default: bool = False
\ No newline at end of file
@@ -1,8 +1,11 @@
 # app/schemas/pipeline.py
-from typing import Dict, Any, Optional, List
+from typing import Optional
 from datetime import datetime
 from pydantic import BaseModel
 
+from app.core.enums import PipelineStatus
+from .base import TimestampMixin, OptJSONDict
+
 class PreprocessingConfig(BaseModel):
     handle_missing: bool = False
     missing_strategy: Optional[str] = "mean"
@@ -31,30 +34,20 @@ class PipelineRequest(BaseModel):
     dataset_id: int
     config: PipelineConfig
 
-class PipelineResponse(BaseModel):
+class PipelineResponse(TimestampMixin):
     pipeline_id: str
-    status: str
+    status: PipelineStatus
     dataset_id: int
     config: PipelineConfig
-    results: Optional[Dict[str, Any]] = None
-    created_at: datetime
-    updated_at: datetime
+    results: OptJSONDict = None
     start_time: Optional[datetime] = None
     end_time: Optional[datetime] = None
     execution_time: Optional[int] = None
     error_message: Optional[str] = None
 
-    class Config:
-        from_attributes = True
-
-class PipelineListResponse(BaseModel):
+class PipelineListResponse(TimestampMixin):
     pipeline_id: str
-    status: str
+    status: PipelineStatus
     dataset_id: int
-    created_at: datetime
-    updated_at: datetime
     execution_time: Optional[int] = None
     error_message: Optional[str] = None
-
-    class Config:
-        from_attributes = True
\ No newline at end of file
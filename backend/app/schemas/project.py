@@ -1,11 +1,11 @@
-from typing import Optional, Dict, Any
+from typing import Optional
 from pydantic import BaseModel
-from .base import TimestampMixin
+from .base import TimestampMixin, OptJSONDict
 
 class ProjectBase(BaseModel):
     name: str
     description: Optional[str] = None
-    settings: Optional[Dict[str, Any]] = None
+    settings: OptJSONDict = None
 
 class ProjectCreate(ProjectBase):
     pass
@@ -15,7 +15,4 @@ class ProjectUpdate(ProjectBase):
 
 class Project(ProjectBase, TimestampMixin):
     id: int
-    owner_id: int
-
-    class Config:
-        from_attributes = True
\ No newline at end of file
+    owner_id: int
\ No newline at end of file
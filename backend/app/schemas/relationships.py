@@ -1,6 +1,5 @@
 # app/schemas/relationships.py
 from typing import Optional
-from pydantic import BaseModel
 from .model import MLModel  # Updated from Model to MLModel
 from .dataset import Dataset
 from .training import Training
@@ -10,13 +9,11 @@ class TrainingWithRelations(Training):
     model: Optional[MLModel]  # Updated to MLModel
     dataset: Optional[Dataset]
 
-    class Config:
-        from_attributes = True
-
 class EvaluationWithRelations(Evaluation):
     model: Optional[MLModel]  # Updated to MLModel
     dataset: Optional[Dataset]
     training: Optional[Training]
 
-    class Config:
-        from_attributes = True
\ No newline at end of file
+# Finalize schemas at import rather than on first validation
+TrainingWithRelations.model_rebuild()
+EvaluationWithRelations.model_rebuild()
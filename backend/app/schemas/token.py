@@ -1,16 +1,23 @@
 # app/schemas/token.py
 from typing import Optional
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
+
+from app.core.enums import TokenType
 
 class Token(BaseModel):
     access_token: str
-    token_type: str
+    token_type: TokenType
 
 class TokenPayload(BaseModel):
     sub: str  # user_id
-    exp: Optional[int] = None  # expiration time
-    type: str = "access"  # token type
-    jti: Optional[str] = None  # unique token identifier
+    exp: int  # expiration time
+    jti: str  # JWT ID for token tracking
+    type: str = "access"  # token type (access or refresh)
+    iat: int  # issued at
+    fresh: bool = False  # whether this is a fresh login token
+
+    # Instances are shared through JWTHandler's payload cache
+    model_config = ConfigDict(extra="ignore", frozen=True)
 
 class TokenData(BaseModel):
     username: Optional[str] = None
\ No newline at end of file
@@ -1,17 +1,12 @@
-from typing import Optional, Dict, Any
+from typing import Optional
 from datetime import datetime
-from pydantic import BaseModel
-from enum import Enum
+from pydantic import BaseModel, ConfigDict
 
-class TrainingStatus(str, Enum):
-    QUEUED = "queued"
-    RUNNING = "running"
-    COMPLETED = "completed"
-    FAILED = "failed"
-    STOPPED = "stopped"
+from app.core.enums import TrainingStatus
+from .base import TimestampMixin, OptJSONDict
 
 class TrainingBase(BaseModel):
-    hyperparameters: Optional[Dict[str, Any]] = None
+    hyperparameters: OptJSONDict = None
     model_id: int
     dataset_id: int
 
@@ -20,30 +15,34 @@ class TrainingCreate(TrainingBase):
 
 class TrainingUpdate(BaseModel):
     status: Optional[TrainingStatus] = None
-    hyperparameters: Optional[Dict[str, Any]] = None
+    hyperparameters: OptJSONDict = None
     error_message: Optional[str] = None
-    metrics: Optional[Dict[str, Any]] = None
+    metrics: OptJSONDict = None
     cpu_usage: Optional[float] = None
     memory_usage: Optional[float] = None
     gpu_usage: Optional[float] = None
 
-class Training(TrainingBase):
+class Training(TrainingBase, TimestampMixin):
     id: int
     owner_id: int
     project_id: Optional[int] = None
     status: TrainingStatus
     start_time: Optional[datetime] = None
     end_time: Optional[datetime] = None
-    updated_at: datetime  # Ensuring `updated_at` is always returned
-    created_at: datetime
     duration: Optional[float] = None  # Auto-calculated based on start & end times
     epochs_completed: Optional[int] = None
-    training_logs: Optional[Dict[str, Any]] = None
-    metrics: Optional[Dict[str, Any]] = None
+    training_logs: OptJSONDict = None
+    metrics: OptJSONDict = None
     error_message: Optional[str] = None
     cpu_usage: Optional[float] = None
     memory_usage: Optional[float] = None
     gpu_usage: Optional[float] = None
 
-    class Config:
-        from_attributes = True
+class TrainingStatusSummary(BaseModel):
+    id: int
+    status: TrainingStatus
+    start_time: Optional[datetime] = None
+    end_time: Optional[datetime] = None
+    error_message: Optional[str] = None
+
+    model_config = ConfigDict(from_attributes=True, frozen=True)
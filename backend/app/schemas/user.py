@@ -1,24 +1,30 @@
 # app/schemas/user.py
-from datetime import datetime
+import re
 from typing import Optional
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, field_validator
+
+from .base import TimestampMixin
+
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
 
 class UserBase(BaseModel):
-    email: EmailStr
+    email: str
     full_name: Optional[str] = None
     is_active: bool = True
 
+    @field_validator("email")
+    @classmethod
+    def validate_email(cls, v: str) -> str:
+        if not _EMAIL_RE.match(v):
+            raise ValueError("invalid email address")
+        return v.lower()
+
 class UserCreate(UserBase):
     password: str
 
 class UserUpdate(UserBase):
     password: Optional[str] = None
 
-class User(UserBase):
+class User(UserBase, TimestampMixin):
     id: int
-    is_superuser: bool = False
-    created_at: datetime
-    updated_at: datetime
-
-    class Config:
-        from_attributes = True
\ No newline at end of file
+    is_superuser: bool = False
\ No newline at end of file
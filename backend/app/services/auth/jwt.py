@@ -1,22 +1,26 @@
-from datetime import datetime, timedelta
+from collections import OrderedDict
+from datetime import timedelta
 from typing import Any, Dict, Optional, Union
-from jose import jwt, JWTError, ExpiredSignatureError
+import jwt
+from jwt import PyJWTError as JWTError
 from fastapi import HTTPException, status
-import uuid
-from pydantic import BaseModel
+import secrets
+import threading
+import time
 import logging
+import orjson
 
 from app.core.config import settings
+from app.schemas.token import TokenPayload
 
 logger = logging.getLogger(__name__)
 
-class TokenPayload(BaseModel):
-    sub: str
-    exp: int
-    jti: str  # JWT ID for token tracking
-    type: str  # Token type (access or refresh)
-    iat: int  # Issued at
-    fresh: bool  # Whether this is a fresh login token
+# Encoded once rather than on every encode/decode call
+_SECRET_KEY_BYTES: bytes = settings.SECRET_KEY.encode("utf-8")
+
+# Claims go through the JWS layer as orjson bytes; PyJWT's claim layer would
+# json.dumps/json.loads them with the stdlib. Claims (exp) are checked here.
+_jws = jwt.PyJWS()
 
 class JWTHandler:
     """JWT token handler with enhanced security features"""
@@ -25,8 +29,16 @@ class JWTHandler:
     ACCESS_TOKEN_EXPIRE_MINUTES = settings.ACCESS_TOKEN_EXPIRE_MINUTES
     REFRESH_TOKEN_EXPIRE_DAYS = 30
     
-    # Token blacklist (in production, use Redis/database)
-    _token_blacklist = set()
+    # Revoked jti -> exp (in production, use Redis/database). Entries are dropped
+    # once the token would have expired anyway, so the map stays bounded.
+    _token_blacklist: Dict[str, int] = {}
+
+    # Recently decoded tokens, so repeat requests skip signature verification
+    PAYLOAD_CACHE_SIZE = 4096
+    _payload_cache: "OrderedDict[str, TokenPayload]" = OrderedDict()
+    # Sync routes run in a threadpool; reordering or evicting cache entries
+    # while another thread does the same can raise KeyError
+    _cache_lock = threading.Lock()
     
     @classmethod
     def create_access_token(
@@ -38,35 +50,35 @@ class JWTHandler:
     ) -> str:
         """Create JWT access token"""
         try:
+            # Registered claims are epoch seconds; read the clock once
+            now = int(time.time())
             if expires_delta:
-                expire = datetime.utcnow() + expires_delta
+                expire = now + int(expires_delta.total_seconds())
             else:
-                expire = datetime.utcnow() + timedelta(
-                    minutes=cls.ACCESS_TOKEN_EXPIRE_MINUTES
-                )
+                expire = now + cls.ACCESS_TOKEN_EXPIRE_MINUTES * 60
 
             to_encode = {
                 "sub": str(subject),
                 "exp": expire,
                 "type": "access",
-                "jti": str(uuid.uuid4()),
-                "iat": datetime.utcnow(),
+                "jti": secrets.token_hex(16),
+                "iat": now,
                 "fresh": fresh
             }
             
             if scopes:
                 to_encode["scopes"] = scopes
 
-            encoded_jwt = jwt.encode(
-                to_encode,
-                settings.SECRET_KEY,
+            encoded_jwt = _jws.encode(
+                orjson.dumps(to_encode),
+                _SECRET_KEY_BYTES,
                 algorithm=cls.ALGORITHM
             )
             
             return encoded_jwt
             
         except Exception as e:
-            logger.error(f"Error creating access token: {str(e)}")
+            logger.error("Error creating access token: %s", e)
             raise
 
     @classmethod
@@ -78,19 +90,15 @@ class JWTHandler:
             Dict containing token claims if valid, None otherwise
         """
         try:
+            # Decode and verify token
+            payload = _decode_claims(token)
+
             # Check if token is blacklisted
-            if cls.is_token_blacklisted(token):
+            if payload.get("jti") in cls._token_blacklist:
                 return None
             
-            # Decode and verify token
-            payload = jwt.decode(
-                token,
-                settings.SECRET_KEY,
-                algorithms=[cls.ALGORITHM]
-            )
-            
-            # Verify expiration
-            if datetime.fromtimestamp(payload["exp"]) < datetime.utcnow():
+            # Only the signature is verified on decode, so exp is enforced here
+            if payload["exp"] < time.time():
                 return None
                 
             return payload
@@ -98,71 +106,92 @@ class JWTHandler:
         except JWTError:
             return None
         except Exception as e:
-            logger.error(f"Error verifying token: {str(e)}")
+            logger.error("Error verifying token: %s", e)
             return None
 
     @classmethod
-    def decode_token(cls, token: str) -> TokenPayload:
+    def decode_token_dict(cls, token: str) -> Dict[str, Any]:
         """
-        Decode and validate JWT token
+        Decode and validate JWT token, returning the raw claims
         
         Raises:
-            HTTPException: If token is invalid or expired
+            HTTPException: If token is invalid, revoked or expired
         """
         try:
+            payload = _decode_claims(token)
+
             # Check if token is blacklisted
-            if cls.is_token_blacklisted(token):
+            if payload.get("jti") in cls._token_blacklist:
                 raise HTTPException(
                     status_code=status.HTTP_401_UNAUTHORIZED,
                     detail="Token has been revoked"
                 )
             
-            payload = jwt.decode(
-                token,
-                settings.SECRET_KEY,
-                algorithms=[cls.ALGORITHM]
-            )
-            
-            token_data = TokenPayload(**payload)
-            
-            # Validate token hasn't expired
-            if datetime.fromtimestamp(token_data.exp) < datetime.utcnow():
+            # Only the signature is verified on decode, so exp is enforced here
+            if payload["exp"] < time.time():
                 raise HTTPException(
                     status_code=status.HTTP_401_UNAUTHORIZED,
                     detail="Token has expired"
                 )
             
-            return token_data
+            return payload
             
-        except ExpiredSignatureError:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Token has expired"
-            )
+        except HTTPException:
+            raise
         except JWTError:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Could not validate credentials"
             )
         except Exception as e:
-            logger.error(f"Error decoding token: {str(e)}")
+            logger.error("Error decoding token: %s", e)
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Could not validate credentials"
             )
 
     @classmethod
-    def is_token_blacklisted(cls, token: str) -> bool:
-        """Check if a token has been revoked"""
+    def decode_token(cls, token: str) -> TokenPayload:
+        """
+        Decode and validate JWT token into a TokenPayload
+        
+        Raises:
+            HTTPException: If token is invalid, revoked or expired
+        """
+        with cls._cache_lock:
+            cached = cls._payload_cache.get(token)
+            if (
+                cached is not None
+                and cached.exp > time.time()
+                and cached.jti not in cls._token_blacklist
+            ):
+                cls._payload_cache.move_to_end(token)
+                return cached
+
+        payload = cls.decode_token_dict(token)
         try:
-            payload = jwt.decode(
-                token,
-                settings.SECRET_KEY,
-                algorithms=[cls.ALGORITHM]
+            token_data = TokenPayload(**payload)
+        except ValueError as e:
+            # Malformed claims are routine rejections, not server errors
+            logger.debug("Rejected token with invalid claims: %s", e)
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Could not validate credentials"
             )
-            return payload.get("jti") in cls._token_blacklist
-        except:
-            return False
+
+        with cls._cache_lock:
+            cls._payload_cache[token] = token_data
+            if len(cls._payload_cache) > cls.PAYLOAD_CACHE_SIZE:
+                cls._payload_cache.popitem(last=False)
+        return token_data
+
+    @classmethod
+    def _prune_blacklist(cls) -> None:
+        """Forget revoked tokens whose expiry has already passed"""
+        now = time.time()
+        expired = [jti for jti, exp in cls._token_blacklist.items() if exp <= now]
+        for jti in expired:
+            del cls._token_blacklist[jti]
 
     @classmethod
     def revoke_token(cls, token: str) -> None:
@@ -170,12 +199,29 @@ class JWTHandler:
         Revoke a token by adding it to blacklist
         """
         try:
-            payload = cls.decode_token(token)
-            cls._token_blacklist.add(payload.jti)
+            token_data = cls.decode_token(token)
+            with cls._cache_lock:
+                cls._prune_blacklist()
+                cls._token_blacklist[token_data.jti] = token_data.exp
+                cls._payload_cache.pop(token, None)
         except Exception as e:
-            logger.error(f"Error revoking token: {str(e)}")
+            logger.error("Error revoking token: %s", e)
             raise
 
+_ALGORITHMS = [JWTHandler.ALGORITHM]
+
+def _decode_claims(token: str) -> Dict[str, Any]:
+    """
+    Verify the signature and decode claims into a fresh dict.
+
+    "exp" isn't validated here; callers check it themselves.
+    """
+    return orjson.loads(_jws.decode(
+        token,
+        _SECRET_KEY_BYTES,
+        algorithms=_ALGORITHMS
+    ))
+
 # Convenience functions
 def create_access_token(*args, **kwargs) -> str:
     """Convenience function for creating access token"""
@@ -1,5 +1,6 @@
 # oauth.py
 from typing import Optional, Dict, Any
+from urllib.parse import urlencode
 import aiohttp
 from fastapi import HTTPException, status
 from pydantic import BaseModel
@@ -8,6 +9,24 @@ from app.core.config import settings
 from app.models.user import User
 from app.schemas.user import UserCreate
 
+# One pooled session shared across requests keeps TLS connections to the providers alive
+_session: Optional[aiohttp.ClientSession] = None
+
+async def _get_session() -> aiohttp.ClientSession:
+    global _session
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=100, ttl_dns_cache=300, keepalive_timeout=60)
+        )
+    return _session
+
+async def close_oauth_session() -> None:
+    """Close the shared provider session; called on application shutdown"""
+    global _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
+
 class OAuthProvider(BaseModel):
     name: str
     client_id: str
@@ -63,26 +82,26 @@ class OAuthHandler:
         """
         provider_config = cls.get_provider(provider)
         
-        async with aiohttp.ClientSession() as session:
-            params = {
-                "client_id": provider_config.client_id,
-                "client_secret": provider_config.client_secret,
-                "code": code,
-                "redirect_uri": redirect_uri,
-                "grant_type": "authorization_code"
-            }
-            
-            async with session.post(
-                provider_config.token_url,
-                params=params,
-                headers={"Accept": "application/json"}
-            ) as response:
-                if response.status != 200:
-                    raise HTTPException(
-                        status_code=status.HTTP_400_BAD_REQUEST,
-                        detail="Failed to get OAuth token"
-                    )
-                return await response.json()
+        session = await _get_session()
+        params = {
+            "client_id": provider_config.client_id,
+            "client_secret": provider_config.client_secret,
+            "code": code,
+            "redirect_uri": redirect_uri,
+            "grant_type": "authorization_code"
+        }
+        
+        async with session.post(
+            provider_config.token_url,
+            params=params,
+            headers={"Accept": "application/json"}
+        ) as response:
+            if response.status != 200:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Failed to get OAuth token"
+                )
+            return await response.json()
 
     @classmethod
     async def get_user_info(
@@ -95,21 +114,21 @@ class OAuthHandler:
         """
         provider_config = cls.get_provider(provider)
         
-        async with aiohttp.ClientSession() as session:
-            headers = {"Authorization": f"Bearer {access_token}"}
-            if provider == "github":
-                headers["Accept"] = "application/vnd.github.v3+json"
-            
-            async with session.get(
-                provider_config.userinfo_url,
-                headers=headers
-            ) as response:
-                if response.status != 200:
-                    raise HTTPException(
-                        status_code=status.HTTP_400_BAD_REQUEST,
-                        detail="Failed to get user info"
-                    )
-                return await response.json()
+        session = await _get_session()
+        headers = {"Authorization": f"Bearer {access_token}"}
+        if provider == "github":
+            headers["Accept"] = "application/vnd.github.v3+json"
+        
+        async with session.get(
+            provider_config.userinfo_url,
+            headers=headers
+        ) as response:
+            if response.status != 200:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Failed to get user info"
+                )
+            return await response.json()
 
     @classmethod
     async def authenticate_oauth(
@@ -159,20 +178,27 @@ class OAuthHandler:
         
         return user
 
+def _build_redirect_url(provider_config: OAuthProvider) -> str:
+    query_string = urlencode({
+        "client_id": provider_config.client_id,
+        "redirect_uri": settings.OAUTH_REDIRECT_URI,
+        "scope": provider_config.scope,
+        "response_type": "code"
+    })
+    return f"{provider_config.authorize_url}?{query_string}"
+
+# Everything in the authorization URL is static per provider
+_REDIRECT_URLS: Dict[str, str] = {
+    name: _build_redirect_url(provider_config)
+    for name, provider_config in OAuthHandler.providers.items()
+}
+
 # Additional utility functions for OAuth flow
 def get_oauth_redirect_url(provider: str) -> str:
     """
     Get OAuth authorization URL
     """
-    provider_config = OAuthHandler.get_provider(provider)
-    
-    params = {
-        "client_id": provider_config.client_id,
-        "redirect_uri": settings.OAUTH_REDIRECT_URI,
-        "scope": provider_config.scope,
-        "response_type": "code"
-    }
-    
-    # Convert params to URL query string
-    query_string = "&".join(f"{k}={v}" for k, v in params.items())
-    return f"{provider_config.authorize_url}?{query_string}"
\ No newline at end of file
+    redirect_url = _REDIRECT_URLS.get(provider)
+    if redirect_url is None:
+        OAuthHandler.get_provider(provider)  # raises the usual 400
+    return redirect_url
@@ -5,10 +5,10 @@ from sklearn.preprocessing import StandardScaler
 import logging
 from pathlib import Path
 import random
-from scipy.interpolate import interp1d
+from scipy.interpolate import CubicSpline
+from imblearn.over_sampling import SMOTE
 import tensorflow as tf
 import torch
-from concurrent.futures import ThreadPoolExecutor
 
 logger = logging.getLogger(__name__)
 
@@ -61,9 +61,32 @@ class DataAugmenter:
             return augmented_data, stats
             
         except Exception as e:
-            logger.error(f"Error in data augmentation: {str(e)}")
+            logger.error("Error in data augmentation: %s", e)
             raise
 
+    async def _apply_smote(
+        self,
+        df: pd.DataFrame,
+        target_column: Optional[str],
+        augmentation_factor: float
+    ) -> pd.DataFrame:
+        """Apply SMOTE oversampling to balance the classes of target_column"""
+        if not target_column or target_column not in df.columns:
+            raise ValueError("SMOTE requires a valid target column")
+        
+        # Hand imblearn plain arrays; it would convert a DataFrame anyway
+        feature_cols = [col for col in df.columns if col != target_column]
+        X = df[feature_cols].to_numpy()
+        y = df[target_column].to_numpy()
+        
+        smote = SMOTE(random_state=self.config.get('random_state', 42))
+        X_resampled, y_resampled = smote.fit_resample(X, y)
+        
+        # fit_resample returns the original rows followed by the synthetic ones
+        augmented = pd.DataFrame(X_resampled, columns=feature_cols, copy=False)
+        augmented[target_column] = y_resampled
+        return augmented
+
     async def _apply_mixup(
         self,
         df: pd.DataFrame,
@@ -76,19 +99,15 @@ class DataAugmenter:
         idx1 = np.random.randint(0, len(df), n_samples)
         idx2 = np.random.randint(0, len(df), n_samples)
         
-        # Generate random weights
-        weights = np.random.beta(0.4, 0.4, n_samples)
+        # Generate random weights, shaped to broadcast across columns
+        weights = np.random.beta(0.4, 0.4, n_samples)[:, None]
         
-        # Create new samples
-        new_samples = []
-        for i in range(n_samples):
-            sample1 = df.iloc[idx1[i]].values
-            sample2 = df.iloc[idx2[i]].values
-            new_sample = weights[i] * sample1 + (1 - weights[i]) * sample2
-            new_samples.append(new_sample)
+        # Blend all pairs at once on the raw array
+        values = df.to_numpy()
+        new_samples = weights * values[idx1] + (1 - weights) * values[idx2]
         
         # Create augmented dataset
-        augmented_samples = pd.DataFrame(new_samples, columns=df.columns)
+        augmented_samples = pd.DataFrame(new_samples, columns=df.columns, copy=False)
         return pd.concat([df, augmented_samples], ignore_index=True)
 
     async def _apply_random_interpolation(
@@ -98,23 +117,20 @@ class DataAugmenter:
     ) -> pd.DataFrame:
         """Apply random interpolation augmentation"""
         n_samples = int(len(df) * augmentation_factor)
-        numerical_cols = df.select_dtypes(include=['int64', 'float64']).columns
+        numerical_cols = df.select_dtypes(include=['int64', 'float64', 'float32']).columns
         
         # Generate random pairs for interpolation
         idx1 = np.random.randint(0, len(df), n_samples)
         idx2 = np.random.randint(0, len(df), n_samples)
         alphas = np.random.uniform(0, 1, n_samples)
         
-        new_samples = []
-        for i in range(n_samples):
-            sample = df.copy().iloc[idx1[i]]
-            for col in numerical_cols:
-                val1 = df.iloc[idx1[i]][col]
-                val2 = df.iloc[idx2[i]][col]
-                sample[col] = val1 + alphas[i] * (val2 - val1)
-            new_samples.append(sample)
+        # One fancy-index for the base rows, then interpolate the numeric block
+        augmented_samples = df.take(idx1)
+        if len(numerical_cols):
+            values = df[numerical_cols].to_numpy(dtype=np.float64)
+            start, end = values[idx1], values[idx2]
+            augmented_samples[numerical_cols] = start + alphas[:, None] * (end - start)
         
-        augmented_samples = pd.DataFrame(new_samples)
         return pd.concat([df, augmented_samples], ignore_index=True)
 
     async def _apply_gaussian_noise(
@@ -124,18 +140,22 @@ class DataAugmenter:
     ) -> pd.DataFrame:
         """Apply Gaussian noise augmentation"""
         n_samples = int(len(df) * augmentation_factor)
-        numerical_cols = df.select_dtypes(include=['int64', 'float64']).columns
+        numerical_cols = df.select_dtypes(include=['int64', 'float64', 'float32']).columns
+        
+        # Noise scale per column is fixed, so compute it once up front
+        noise_scales = df[numerical_cols].std().to_numpy() * 0.1
         
-        # Generate noisy samples
-        new_samples = []
-        for _ in range(n_samples):
-            sample = df.sample(n=1).copy()
-            for col in numerical_cols:
-                noise = np.random.normal(0, df[col].std() * 0.1)
-                sample[col] += noise
-            new_samples.append(sample)
+        # Draw all source rows and the full noise matrix in one go
+        rng = np.random.default_rng()
+        rows = rng.integers(0, len(df), n_samples)
+        # take() already returns a fresh frame, no defensive copy needed
+        augmented_samples = df.take(rows)
+        if len(numerical_cols):
+            noise = rng.standard_normal((n_samples, len(numerical_cols))) * noise_scales
+            augmented_samples[numerical_cols] = (
+                augmented_samples[numerical_cols].to_numpy(dtype=np.float64) + noise
+            )
         
-        augmented_samples = pd.concat(new_samples)
         return pd.concat([df, augmented_samples], ignore_index=True)
 
     async def _apply_time_warping(
@@ -149,24 +169,27 @@ class DataAugmenter:
         
         n_samples = int(len(df) * augmentation_factor)
         time_col = df.select_dtypes(include=['datetime64']).columns[0]
-        numerical_cols = df.select_dtypes(include=['int64', 'float64']).columns
+        numerical_cols = df.select_dtypes(include=['int64', 'float64', 'float32']).columns
         
-        new_samples = []
-        for _ in range(n_samples):
-            # Create warped time points
-            time_points = np.arange(len(df))
-            warped_points = time_points + np.random.normal(0, 2, len(time_points))
-            warped_points = np.sort(warped_points)
-            
-            # Interpolate values
-            sample = df.copy()
-            for col in numerical_cols:
-                interpolator = interp1d(time_points, df[col], kind='cubic', bounds_error=False)
-                sample[col] = interpolator(warped_points)
-            
-            new_samples.append(sample)
+        # Every sample is a full copy of the series on its own warped time grid
+        time_points = np.arange(len(df))
+        warped_points = np.sort(
+            time_points + np.random.normal(0, 2, (n_samples, len(time_points))),
+            axis=1
+        )
+        augmented_samples = df.take(np.tile(time_points, n_samples))
+        
+        if len(numerical_cols):
+            # One not-a-knot spline over all columns (same fit as interp1d's
+            # 'cubic'), evaluated on every grid at once; NaN outside the range
+            spline = CubicSpline(
+                time_points,
+                df[numerical_cols].to_numpy(dtype=np.float64),
+                axis=0,
+                extrapolate=False
+            )
+            augmented_samples[numerical_cols] = spline(warped_points.ravel())
         
-        augmented_samples = pd.concat(new_samples)
         return pd.concat([df, augmented_samples], ignore_index=True)
 
     async def _calculate_augmentation_stats(
@@ -184,22 +207,16 @@ class DataAugmenter:
             'feature_stats': {}
         }
         
-        numerical_cols = original_data.select_dtypes(include=['int64', 'float64']).columns
+        numerical_cols = original_data.select_dtypes(include=['int64', 'float64', 'float32']).columns
+        
+        # One reduction per frame for all columns and statistics
+        summary_stats = ['mean', 'std', 'min', 'max']
+        original_summary = original_data[numerical_cols].agg(summary_stats)
+        augmented_summary = augmented_data[numerical_cols].agg(summary_stats)
         
         for col in numerical_cols:
-            original_stats = {
-                'mean': float(original_data[col].mean()),
-                'std': float(original_data[col].std()),
-                'min': float(original_data[col].min()),
-                'max': float(original_data[col].max())
-            }
-            
-            augmented_stats = {
-                'mean': float(augmented_data[col].mean()),
-                'std': float(augmented_data[col].std()),
-                'min': float(augmented_data[col].min()),
-                'max': float(augmented_data[col].max())
-            }
+            original_stats = {name: float(value) for name, value in original_summary[col].items()}
+            augmented_stats = {name: float(value) for name, value in augmented_summary[col].items()}
             
             stats['feature_stats'][col] = {
                 'original': original_stats,
@@ -233,32 +250,31 @@ class DataAugmenter:
             'correlation_preserved': True
         }
         
-        numerical_cols = original_data.select_dtypes(include=['int64', 'float64']).columns
+        numerical_cols = original_data.select_dtypes(include=['int64', 'float64', 'float32']).columns
+        
+        if not len(numerical_cols):
+            return validation_results
+        
+        original = original_data[numerical_cols]
+        augmented = augmented_data[numerical_cols]
         
         # Check distribution preservation
-        for col in numerical_cols:
-            original_mean = original_data[col].mean()
-            augmented_mean = augmented_data[col].mean()
-            mean_diff = abs(original_mean - augmented_mean) / original_mean
-            
-            if mean_diff > threshold:
-                validation_results['distribution_preserved'] = False
-                break
+        original_mean = original.mean()
+        mean_diff = (original_mean - augmented.mean()).abs() / original_mean
+        if (mean_diff > threshold).any():
+            validation_results['distribution_preserved'] = False
         
         # Check range preservation
-        for col in numerical_cols:
-            original_range = original_data[col].max() - original_data[col].min()
-            augmented_range = augmented_data[col].max() - augmented_data[col].min()
-            range_diff = abs(original_range - augmented_range) / original_range
-            
-            if range_diff > threshold:
-                validation_results['range_preserved'] = False
-                break
+        original_range = original.max() - original.min()
+        augmented_range = augmented.max() - augmented.min()
+        range_diff = (original_range - augmented_range).abs() / original_range
+        if (range_diff > threshold).any():
+            validation_results['range_preserved'] = False
         
-        # Check correlation preservation
-        original_corr = original_data[numerical_cols].corr()
-        augmented_corr = augmented_data[numerical_cols].corr()
-        corr_diff = np.abs(original_corr - augmented_corr).max()
+        # Check correlation preservation; np.corrcoef needs complete rows
+        original_corr = np.corrcoef(original.dropna().to_numpy(dtype=np.float64), rowvar=False)
+        augmented_corr = np.corrcoef(augmented.dropna().to_numpy(dtype=np.float64), rowvar=False)
+        corr_diff = np.nanmax(np.abs(original_corr - augmented_corr))
         
         if corr_diff > threshold:
             validation_results['correlation_preserved'] = False
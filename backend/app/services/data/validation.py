@@ -3,10 +3,21 @@ from typing import Dict, List, Optional, Tuple
 import pandas as pd
 import numpy as np
 from pydantic import BaseModel, Field
+import asyncio
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Expected type name -> accepted scalar types for a column's dtype.type
+_TYPE_MAPPING = {
+    'numeric': (np.number, float, int),
+    'integer': (np.integer, int),
+    'float': (np.floating, float),
+    'string': (str, np.object_),
+    'boolean': (bool, np.bool_),
+    'datetime': (np.datetime64, pd.Timestamp)
+}
+
 class ValidationConfig(BaseModel):
     required_columns: List[str] = Field(default_factory=list)
     column_types: Dict[str, str] = Field(default_factory=dict)
@@ -20,6 +31,11 @@ class DataValidator:
 
     async def validate_dataset(self, df: pd.DataFrame) -> Tuple[bool, List[str]]:
         """Validate dataset against configuration"""
+        # The checks are blocking pandas/NumPy work; keep them off the event loop
+        return await asyncio.to_thread(self._validate, df)
+
+    def _validate(self, df: pd.DataFrame) -> Tuple[bool, List[str]]:
+        """Run all configured checks synchronously"""
         errors = []
         
         try:
@@ -41,15 +57,24 @@ class DataValidator:
                     min_val = range_dict.get('min')
                     max_val = range_dict.get('max')
                     if min_val is not None and max_val is not None:
-                        mask = ~df[col].between(min_val, max_val)
-                        if mask.any():
-                            errors.append(f"Column {col} has values outside range [{min_val}, {max_val}]")
+                        if not pd.api.types.is_numeric_dtype(df[col]):
+                            errors.append(
+                                f"Column {col} is not numeric; cannot check range [{min_val}, {max_val}]"
+                            )
+                            continue
+                        # Count on the raw array; NaN compares False, so missing
+                        # values are left to the missing-value check
+                        values = df[col].to_numpy(dtype=np.float64, na_value=np.nan)
+                        out_of_range = np.count_nonzero((values < min_val) | (values > max_val))
+                        if out_of_range:
+                            errors.append(
+                                f"Column {col} has {out_of_range} values outside range [{min_val}, {max_val}]"
+                            )
 
-            # Check missing values
-            for col in df.columns:
-                missing_ratio = df[col].isnull().mean()
-                if missing_ratio > self.config.max_missing_ratio:
-                    errors.append(f"Column {col} has {missing_ratio:.2%} missing values")
+            # Check missing values: one reduction over the whole frame
+            missing_ratios = df.isnull().mean()
+            for col, missing_ratio in missing_ratios[missing_ratios > self.config.max_missing_ratio].items():
+                errors.append(f"Column {col} has {missing_ratio:.2%} missing values")
 
             # Check unique constraints
             for col in self.config.unique_columns:
@@ -65,16 +90,7 @@ class DataValidator:
 
     def _check_column_type(self, series: pd.Series, expected_type: str) -> bool:
         """Check if column data type matches expected type"""
-        type_mapping = {
-            'numeric': (np.number, float, int),
-            'integer': (np.integer, int),
-            'float': (np.floating, float),
-            'string': (str, object),
-            'boolean': (bool, np.bool_),
-            'datetime': (np.datetime64, pd.Timestamp)
-        }
-        
-        if expected_type not in type_mapping:
+        if expected_type not in _TYPE_MAPPING:
             return False
             
-        return pd.api.types.is_dtype_type(series.dtype.type, type_mapping[expected_type])
\ No newline at end of file
+        return issubclass(series.dtype.type, _TYPE_MAPPING[expected_type])
\ No newline at end of file
@@ -127,8 +127,9 @@ class ModelDeploymentService:
         """Make prediction using loaded model"""
         try:
             if self.framework == "pytorch":
-                with torch.no_grad():
-                    tensor_input = torch.FloatTensor(data)
+                # from_numpy shares the float32 buffer instead of copying it
+                tensor_input = torch.from_numpy(np.asarray(data, dtype=np.float32))
+                with torch.inference_mode():
                     prediction = self.model(tensor_input).numpy()
                     
             elif self.framework == "tensorflow":
@@ -165,7 +166,8 @@ class ModelDeploymentService:
             
             # Load model based on framework
             if self.framework == "pytorch":
-                self.model = torch.load(self.model_path)
+                # mmap leaves tensor storage in the page cache, shared across workers
+                self.model = torch.load(self.model_path, map_location='cpu', mmap=True)
                 self.model.eval()
                 
             elif self.framework == "tensorflow":
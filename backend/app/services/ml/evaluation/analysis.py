@@ -106,7 +106,7 @@ class DataAnalysisService:
             )
 
             # Value ranges for numerical columns
-            numerical_cols = df.select_dtypes(include=['int64', 'float64']).columns
+            numerical_cols = df.select_dtypes(include=['int64', 'float64', 'float32']).columns
             if len(numerical_cols) > 0:
                 fig.add_trace(
                     go.Box(
@@ -145,7 +145,7 @@ class DataAnalysisService:
     async def _analyze_correlations(self, df: pd.DataFrame) -> Optional[Dict]:
         """Analyze feature correlations"""
         try:
-            numerical_cols = df.select_dtypes(include=['int64', 'float64']).columns
+            numerical_cols = df.select_dtypes(include=['int64', 'float64', 'float32']).columns
             
             if len(numerical_cols) > 1:
                 corr_matrix = df[numerical_cols].corr()
@@ -183,7 +183,7 @@ class DataAnalysisService:
         """Analyze feature distributions"""
         try:
             distributions = {}
-            numerical_cols = df.select_dtypes(include=['int64', 'float64']).columns
+            numerical_cols = df.select_dtypes(include=['int64', 'float64', 'float32']).columns
 
             for col in numerical_cols:
                 # Create distribution plot
@@ -8,7 +8,7 @@ import os
 import torch
 import tensorflow as tf
 import joblib
-from app.models.training import Training
+from app.models.training import Training, TrainingStatus
 from app.models.model import MLModel
 from app.models.dataset import Dataset
 from app.services.ml.training import PyTorchTrainer, TensorFlowTrainer, SklearnTrainer
@@ -112,7 +112,7 @@ async def start_training_job(training_id: int, db: Session) -> None:
             logger.error(f"Training job {training_id} not found")
             return
 
-        training.status = "running"
+        training.status = TrainingStatus.RUNNING
         training.start_time = datetime.now(timezone.utc)
         db.commit()
 
@@ -157,9 +157,10 @@ async def start_training_job(training_id: int, db: Session) -> None:
         )
         
         model.file_path = file_path
+        model.size = os.path.getsize(file_path)
         db.add(model)
 
-        training.status = "completed"
+        training.status = TrainingStatus.COMPLETED
         training.end_time = datetime.now(timezone.utc)
         training.duration = (training.end_time - training.start_time).total_seconds()
         training.metrics = {"history": history}
@@ -171,7 +172,7 @@ async def start_training_job(training_id: int, db: Session) -> None:
     except Exception as e:
         logger.error(f"Error in training job {training_id}: {str(e)}")
         if training:
-            training.status = "failed"
+            training.status = TrainingStatus.FAILED
             training.error_message = str(e)
             training.end_time = datetime.now(timezone.utc)
             if training.start_time:
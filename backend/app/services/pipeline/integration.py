@@ -2,11 +2,12 @@
 from typing import Dict, Any, Optional, Union, List
 import pandas as pd
 import numpy as np
+import asyncio
 import logging
 from pathlib import Path
 import json
 
-from app.services.data.preprocessing import DataPreprocessor
+from app.services.data.preprocessing import DataPreprocessor, ensure_dataframe
 from app.services.data.validation import DataValidator
 from app.services.ml.evaluation.analysis import DataAnalysisService
 
@@ -20,30 +21,6 @@ class PipelineIntegrationService:
         self.analyzer = DataAnalysisService(self.config.get('analysis_config', {}))
         self._pipeline_stats = {}
 
-    def _ensure_dataframe(
-        self,
-        data: Union[pd.DataFrame, np.ndarray, str, Path],
-        feature_names: Optional[List[str]] = None
-    ) -> pd.DataFrame:
-        """Convert input data to pandas DataFrame"""
-        if isinstance(data, pd.DataFrame):
-            return data
-        elif isinstance(data, np.ndarray):
-            columns = feature_names if feature_names else [f'feature_{i}' for i in range(data.shape[1])]
-            return pd.DataFrame(data, columns=columns)
-        elif isinstance(data, (str, Path)):
-            file_path = str(data)
-            if file_path.endswith('.csv'):
-                return pd.read_csv(file_path)
-            elif file_path.endswith('.parquet'):
-                return pd.read_parquet(file_path)
-            elif file_path.endswith(('.xls', '.xlsx')):
-                return pd.read_excel(file_path)
-            else:
-                raise ValueError(f"Unsupported file format: {file_path}")
-        else:
-            raise ValueError(f"Unsupported data type: {type(data)}")
-
     async def process_dataset(
         self,
         data: Union[pd.DataFrame, np.ndarray, str, Path],
@@ -52,8 +29,8 @@ class PipelineIntegrationService:
     ) -> Dict[str, Any]:
         """Process dataset through the pipeline"""
         try:
-            # Convert input to DataFrame
-            df = self._ensure_dataframe(data)
+            # Convert input to DataFrame; file reads run off the event loop
+            df = await asyncio.to_thread(ensure_dataframe, data)
 
             # Initial validation
             is_valid, validation_errors = await self.validator.validate_dataset(df)
@@ -1,35 +1,30 @@
 # app/utils/serialization.py
 import numpy as np
-from typing import Any, Dict, List, Union
-import json
+from typing import Any
+import orjson
 
-def convert_numpy_types(obj: Any) -> Any:
-    """Convert numpy types to Python native types"""
-    if isinstance(obj, np.integer):
-        return int(obj)
-    elif isinstance(obj, np.floating):
-        return float(obj)
-    elif isinstance(obj, np.ndarray):
+ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+def _orjson_default(obj: Any) -> Any:
+    """Fallback for values orjson cannot serialize natively"""
+    if isinstance(obj, np.generic):
+        return obj.item()
+    # OPT_SERIALIZE_NUMPY only covers C-contiguous numeric arrays; object/str
+    # dtypes and strided views land here
+    if isinstance(obj, np.ndarray):
         return obj.tolist()
-    elif isinstance(obj, dict):
-        return {key: convert_numpy_types(value) for key, value in obj.items()}
-    elif isinstance(obj, list):
-        return [convert_numpy_types(item) for item in obj]
-    elif isinstance(obj, tuple):
-        return tuple(convert_numpy_types(item) for item in obj)
-    elif isinstance(obj, (np.bool_, bool)):
-        return bool(obj)
-    return obj
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+def dumps_json(obj: Any) -> bytes:
+    """Serialize to JSON bytes, handling numpy scalars and arrays in C"""
+    return orjson.dumps(obj, default=_orjson_default, option=ORJSON_OPTIONS)
+
+def dumps_json_str(obj: Any) -> str:
+    """Serialize to a JSON string; used as the engine-wide JSON column serializer"""
+    return dumps_json(obj).decode()
 
-class NumpyJSONEncoder(json.JSONEncoder):
-    """Custom JSON encoder for numpy types"""
-    def default(self, obj):
-        if isinstance(obj, np.integer):
-            return int(obj)
-        elif isinstance(obj, np.floating):
-            return float(obj)
-        elif isinstance(obj, np.ndarray):
-            return obj.tolist()
-        elif isinstance(obj, np.bool_):
-            return bool(obj)
-        return super().default(obj)
\ No newline at end of file
+def to_json_compatible(obj: Any) -> Any:
+    """Convert numpy-bearing structures to plain JSON types in a single orjson pass"""
+    return orjson.loads(dumps_json(obj))
@@ -12,6 +12,16 @@ from fastapi import HTTPException
 
 logger = logging.getLogger(__name__)
 
+# Expected type name -> accepted scalar types for a column's dtype.type
+_TYPE_MAPPING = {
+    'numeric': (np.number, float, int),
+    'integer': (np.integer, int),
+    'float': (np.floating, float),
+    'string': (str, np.object_),
+    'boolean': (bool, np.bool_),
+    'datetime': (np.datetime64, pd.Timestamp)
+}
+
 class DataValidator:
     """
     Validator for ML-related data inputs
@@ -47,17 +57,32 @@ class DataValidator:
             
             # Check value ranges
             if 'value_ranges' in requirements:
-                for col, (min_val, max_val) in requirements['value_ranges'].items():
+                for col, range_dict in requirements['value_ranges'].items():
                     if col in data.columns:
-                        if not data[col].between(min_val, max_val).all():
-                            errors.append(f"Column {col} contains values outside range [{min_val}, {max_val}]")
+                        min_val = range_dict.get('min')
+                        max_val = range_dict.get('max')
+                        if min_val is None or max_val is None:
+                            continue
+                        if not pd.api.types.is_numeric_dtype(data[col]):
+                            errors.append(
+                                f"Column {col} is not numeric; cannot check range [{min_val}, {max_val}]"
+                            )
+                            continue
+                        values = data[col].to_numpy(dtype=np.float64, na_value=np.nan)
+                        out_of_range = np.count_nonzero((values < min_val) | (values > max_val))
+                        if out_of_range:
+                            errors.append(
+                                f"Column {col} contains {out_of_range} values outside range [{min_val}, {max_val}]"
+                            )
             
             # Check missing values
-            if 'max_missing_ratio' in requirements:
-                for col in data.columns:
-                    missing_ratio = data[col].isnull().mean()
-                    if missing_ratio > requirements['max_missing_ratio']:
-                        errors.append(f"Column {col} has too many missing values ({missing_ratio:.2%})")
+            if 'max_missing_ratio' in requirements and len(data):
+                # One 2-D reduction, then format only the offending columns
+                missing_ratios = data.isna().to_numpy().sum(axis=0, dtype=np.int64) / len(data)
+                for i in np.flatnonzero(missing_ratios > requirements['max_missing_ratio']):
+                    errors.append(
+                        f"Column {data.columns[i]} has too many missing values ({missing_ratios[i]:.2%})"
+                    )
             
             # Check unique constraints
             if 'unique_columns' in requirements:
@@ -77,19 +102,10 @@ class DataValidator:
         """
         Check if column data type matches expected type
         """
-        type_mapping = {
-            'numeric': (np.number, float, int),
-            'integer': (np.integer, int),
-            'float': (np.floating, float),
-            'string': (str, object),
-            'boolean': (bool, np.bool_),
-            'datetime': (np.datetime64, pd.Timestamp)
-        }
-        
-        if expected_type not in type_mapping:
+        if expected_type not in _TYPE_MAPPING:
             raise ValueError(f"Unsupported type: {expected_type}")
             
-        return isinstance(series.dtype.type, type_mapping[expected_type])
+        return issubclass(series.dtype.type, _TYPE_MAPPING[expected_type])
 
 class ModelConfigValidator:
     """
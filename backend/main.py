@@ -5,6 +5,7 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.core.config import settings
 from app.api.v1 import api_router
+from app.services.auth.oauth import close_oauth_session
 
 logger = logging.getLogger(__name__)
 
@@ -41,6 +42,8 @@ def create_app() -> FastAPI:
     async def shutdown_event():
         logger.info("Shutting down application...")
         try:
+            await close_oauth_session()
+
             tasks = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
             
             # Cancel tasks properly
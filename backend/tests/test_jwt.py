@@ -0,0 +1,121 @@
+# tests/test_jwt.py
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+import pytest
+from fastapi import HTTPException
+
+from app.schemas.token import TokenPayload
+from app.services.auth.jwt import (
+    JWTHandler,
+    create_access_token,
+    decode_access_token,
+    verify_token,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_handler_state():
+    JWTHandler._token_blacklist.clear()
+    JWTHandler._payload_cache.clear()
+    yield
+    JWTHandler._token_blacklist.clear()
+    JWTHandler._payload_cache.clear()
+
+
+def test_create_and_decode():
+    token = create_access_token(42, fresh=True)
+    payload = decode_access_token(token)
+
+    assert isinstance(payload, TokenPayload)
+    assert payload.sub == "42"
+    assert payload.type == "access"
+    assert payload.fresh is True
+    assert payload.exp > payload.iat
+
+
+def test_tokens_get_distinct_jtis():
+    first = decode_access_token(create_access_token("1"))
+    second = decode_access_token(create_access_token("1"))
+    assert first.jti != second.jti
+
+
+def test_decode_reuses_cached_payload():
+    token = create_access_token("1")
+    assert decode_access_token(token) is decode_access_token(token)
+
+
+def test_expired_token_is_rejected():
+    token = create_access_token("1", expires_delta=timedelta(seconds=-1))
+
+    with pytest.raises(HTTPException) as exc_info:
+        decode_access_token(token)
+    assert exc_info.value.status_code == 401
+    assert exc_info.value.detail == "Token has expired"
+    assert verify_token(token) is None
+
+
+def test_tampered_token_is_rejected():
+    token = create_access_token("1")
+    header, claims, signature = token.split(".")
+    tampered = ".".join((header, claims, signature[::-1]))
+
+    with pytest.raises(HTTPException) as exc_info:
+        decode_access_token(tampered)
+    assert exc_info.value.status_code == 403
+    assert verify_token(tampered) is None
+
+
+def test_verify_token_returns_independent_claims():
+    token = create_access_token("1", scopes=["read"])
+    claims = verify_token(token)
+
+    assert claims["sub"] == "1"
+    assert claims["scopes"] == ["read"]
+    claims["sub"] = "mutated"
+    assert verify_token(token)["sub"] == "1"
+
+
+def test_revoke_token():
+    token = create_access_token("1")
+    decode_access_token(token)  # populate the payload cache
+
+    JWTHandler.revoke_token(token)
+
+    with pytest.raises(HTTPException) as exc_info:
+        decode_access_token(token)
+    assert exc_info.value.status_code == 401
+    assert exc_info.value.detail == "Token has been revoked"
+    assert verify_token(token) is None
+
+
+def test_revoke_leaves_other_tokens_valid():
+    revoked = create_access_token("1")
+    other = create_access_token("1")
+
+    JWTHandler.revoke_token(revoked)
+
+    assert decode_access_token(other).sub == "1"
+
+
+def test_revoke_prunes_expired_entries():
+    JWTHandler._token_blacklist["stale"] = 0
+
+    JWTHandler.revoke_token(create_access_token("1"))
+
+    assert "stale" not in JWTHandler._token_blacklist
+
+
+def test_concurrent_decode_and_eviction(monkeypatch):
+    monkeypatch.setattr(JWTHandler, "PAYLOAD_CACHE_SIZE", 4)
+    tokens = [create_access_token(str(i)) for i in range(16)]
+
+    def decode_all(offset):
+        for _ in range(50):
+            for token in tokens[offset:] + tokens[:offset]:
+                decode_access_token(token)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(decode_all, range(8)))
+
+    assert len(JWTHandler._payload_cache) <= 4
@@ -0,0 +1,28 @@
+# tests/test_schemas.py
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+# Run in a fresh interpreter so modules imported by other tests don't mask it
+_CHECK = """
+import sys
+import app.schemas as schemas
+for name in schemas.__all__:
+    getattr(schemas, name)
+loaded = sorted(m for m in sys.modules if m.startswith("app.models"))
+assert not loaded, loaded
+"""
+
+
+def test_schemas_do_not_load_orm_models():
+    result = subprocess.run(
+        [sys.executable, "-c", _CHECK],
+        cwd=BACKEND_DIR,
+        env=os.environ.copy(),
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stderr
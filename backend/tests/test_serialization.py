@@ -0,0 +1,48 @@
+# tests/test_serialization.py
+import numpy as np
+
+from app.utils.serialization import dumps_json_str, to_json_compatible
+
+
+def test_numeric_ndarray():
+    assert to_json_compatible({"a": np.arange(3)}) == {"a": [0, 1, 2]}
+
+
+def test_two_dimensional_ndarray():
+    assert to_json_compatible(np.array([[1.5, 2.5], [3.5, 4.5]])) == [[1.5, 2.5], [3.5, 4.5]]
+
+
+def test_non_contiguous_ndarray():
+    column = np.arange(6).reshape(2, 3)[:, 1]
+    assert not column.flags["C_CONTIGUOUS"]
+    assert to_json_compatible(column) == [1, 4]
+
+
+def test_str_and_object_ndarrays():
+    assert to_json_compatible(np.array(["x", "y"])) == ["x", "y"]
+    assert to_json_compatible(np.array([1, "a", None], dtype=object)) == [1, "a", None]
+
+
+def test_numpy_generics():
+    result = to_json_compatible({
+        "int": np.int64(7),
+        "float": np.float32(1.5),
+        "bool": np.bool_(True),
+    })
+    assert result == {"int": 7, "float": 1.5, "bool": True}
+    assert type(result["int"]) is int
+    assert type(result["bool"]) is bool
+
+
+def test_sets():
+    assert sorted(to_json_compatible({"s": {3, 1, 2}})["s"]) == [1, 2, 3]
+    assert to_json_compatible(frozenset({"a"})) == ["a"]
+
+
+def test_nested_structures_and_non_str_keys():
+    value = {1: [np.float64(0.25), (np.int32(2), {"k": np.arange(2)})]}
+    assert to_json_compatible(value) == {"1": [0.25, [2, {"k": [0, 1]}]]}
+
+
+def test_dumps_json_str_returns_str():
+    assert dumps_json_str({"a": np.int8(1)}) == '{"a":1}'
@@ -0,0 +1,35 @@
+# tests/test_validation.py
+import numpy as np
+import pandas as pd
+
+from app.utils.validation import DataValidator
+
+
+def test_value_range_counts_out_of_range_values():
+    data = pd.DataFrame({"age": [5, 50, 150, np.nan]})
+
+    is_valid, errors = DataValidator.validate_dataset(
+        data, {"value_ranges": {"age": {"min": 0, "max": 120}}}
+    )
+
+    assert not is_valid
+    assert errors == ["Column age contains 1 values outside range [0, 120]"]
+
+
+def test_value_range_on_non_numeric_column():
+    data = pd.DataFrame({"name": ["a", "b"], "id": [1, 1]})
+
+    is_valid, errors = DataValidator.validate_dataset(
+        data,
+        {
+            "value_ranges": {"name": {"min": 0, "max": 1}},
+            "unique_columns": ["id"],
+        },
+    )
+
+    assert not is_valid
+    # The remaining checks still run after the range check rejects the column
+    assert errors == [
+        "Column name is not numeric; cannot check range [0, 1]",
+        "Column id contains duplicate values",
+    ]
@@ -2,7 +2,7 @@
 export const FRAMEWORKS = [
   { value: 'pytorch', label: 'PyTorch' },
   { value: 'tensorflow', label: 'TensorFlow' },
-  { value: 'jax', label: 'JAX' },
+  { value: 'sklearn', label: 'scikit-learn' },
 ] as const;
 
 export const ARCHITECTURES = [